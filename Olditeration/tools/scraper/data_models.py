@@ -26,7 +26,7 @@ class TournamentStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a StarCraft 2 player."""
     name: str
@@ -53,7 +53,7 @@ class Player:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class Team:
     """Represents a 2v2 team."""
     name: str
@@ -61,18 +61,20 @@ class Team:
     player2: Player
     db_id: Optional[str] = None  # Database UUID
     
+    def _player_key(self) -> tuple:
+        """Player slugs in sorted order, so the key is independent of player order."""
+        slug1 = self.player1.liquipedia_slug
+        slug2 = self.player2.liquipedia_slug
+        return (slug1, slug2) if slug1 <= slug2 else (slug2, slug1)
+    
     def __hash__(self) -> int:
-        # Sort players for consistent hashing regardless of order
-        players = sorted([self.player1.liquipedia_slug, self.player2.liquipedia_slug])
-        return hash(tuple(players))
+        return hash(self._player_key())
     
     def __eq__(self, other) -> bool:
         if not isinstance(other, Team):
             return False
         # Teams are equal if they have the same players
-        self_players = {self.player1.liquipedia_slug, self.player2.liquipedia_slug}
-        other_players = {other.player1.liquipedia_slug, other.player2.liquipedia_slug}
-        return self_players == other_players
+        return self._player_key() == other._player_key()
     
     def to_db_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database insertion."""
@@ -83,7 +85,7 @@ class Team:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """Represents a single game (map) within a match."""
     game_number: int
@@ -92,7 +94,7 @@ class Game:
     duration_seconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Represents a match between two teams."""
     match_id: str  # Unique identifier from Liquipedia
@@ -131,7 +133,7 @@ class Match:
         return f"{team1_wins}-{team2_wins}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tournament:
     """Represents a tournament."""
     name: str
@@ -151,12 +153,9 @@ class Tournament:
         """Add a match to this tournament."""
         self.matches.append(match)
         # Automatically add teams and players
-        self.teams.add(match.team1)
-        self.teams.add(match.team2)
-        self.players.add(match.team1.player1)
-        self.players.add(match.team1.player2)
-        self.players.add(match.team2.player1)
-        self.players.add(match.team2.player2)
+        self.teams.update((match.team1, match.team2))
+        self.players.update((match.team1.player1, match.team1.player2,
+                             match.team2.player1, match.team2.player2))
     
     @property
     def race_counts(self) -> Dict[str, int]:
@@ -180,7 +179,7 @@ class Tournament:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingTask:
     """Represents a scraping task."""
     tournament_slug: str
@@ -198,7 +197,7 @@ class ScrapingTask:
         self.retry_count += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Represents the result of a scraping operation."""
     tournament_slug: str
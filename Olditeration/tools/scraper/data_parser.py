@@ -16,6 +16,23 @@ from data_models import (
 
 logger = logging.getLogger(__name__)
 
+# Wikitext patterns, compiled once and shared by every parse
+_MATCH_BLOCK_RE = re.compile(r'(\w+)=\{\{Match')
+_INFOBOX_RE = re.compile(r'\{\{Infobox\s+league\s*\n(.*?)\n\}\}', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_INFOBOX_MAP_RE = re.compile(r'\|map\d+=([^|\n]+)')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_BRACES_RE = re.compile(r'[{}]')
+_OPPONENT1_RE = re.compile(r'opponent1=\{\{2Opponent\|([^}]+)\}\}')
+_OPPONENT2_RE = re.compile(r'opponent2=\{\{2Opponent\|([^}]+)\}\}')
+_PLAYER1_RE = re.compile(r'p1=([^|]+)')
+_PLAYER2_RE = re.compile(r'p2=([^|]+)')
+_SCORE1_RE = re.compile(r'opponent1=\{\{2Opponent\|[^}]*?\|score=(\d+)\}\}')
+_SCORE2_RE = re.compile(r'opponent2=\{\{2Opponent\|[^}]*?\|score=(\d+)\}\}')
+_BEST_OF_RE = re.compile(r'bestof=(\d+)')
+_DATE_RE = re.compile(r'date=([^|}]+)')
+_ABBR_RE = re.compile(r'\{\{abbr/[^}]*\}\}')
+_GAME_MAP_RE = re.compile(r'map(\d+)=\{\{Map\|[^}]*?map=([^|}]+)[^}]*?\|winner=([^|}]+)[^}]*\}\}')
+
 
 class DataParser:
     """Wikitext parser for Liquipedia tournament data."""
@@ -26,7 +43,7 @@ class DataParser:
     
     def parse_tournament_from_wikitext(self, tournament_slug: str, wikitext: str) -> Tournament:
         """Parse tournament data from MediaWiki wikitext."""
-        logger.debug(f"Parsing tournament from wikitext: {tournament_slug}")
+        logger.debug("Parsing tournament from wikitext: %s", tournament_slug)
         
         # Parse infobox for tournament metadata
         infobox = self._parse_infobox(wikitext)
@@ -53,7 +70,7 @@ class DataParser:
             maps=self._parse_maps(wikitext)
         )
         
-        logger.debug(f"Parsed tournament: {tournament.name}")
+        logger.debug("Parsed tournament: %s", tournament.name)
         return tournament
     
 
@@ -63,37 +80,44 @@ class DataParser:
         logger.debug("Parsing matches from wikitext...")
         
         # Find all match blocks with their positions to handle duplicates
-        match_block_pattern = r'(\w+)=\{\{Match'
         match_positions = []
         
         # Find all matches with their positions in the text
-        for match in re.finditer(match_block_pattern, wikitext):
+        for match in _MATCH_BLOCK_RE.finditer(wikitext):
             match_id = match.group(1)
             position = match.start()
             match_positions.append((match_id, position))
         
-        logger.debug(f"Found {len(match_positions)} match blocks")
+        logger.debug("Found %d match blocks", len(match_positions))
         
         # Track processed matches to handle duplicates between groups
         processed_matches = {}  # unique_key -> match_object
         existing_match_ids = set()  # For efficient lookups
         
+        # Bind per-match helpers once rather than resolving them on every iteration
+        extract_match_content = self._extract_match_content_at_position
+        extract_opponents = self._extract_opponents
+        create_teams = self._create_teams_from_opponents
+        generate_final_match_id = self._generate_final_match_id
+        create_match = self._create_match_from_wikitext
+        add_match = tournament.matches.append
+        
         for i, (match_id, position) in enumerate(match_positions):
             try:
-                match_content = self._extract_match_content_at_position(wikitext, match_id, position)
+                match_content = extract_match_content(wikitext, match_id, position)
                 if not match_content:
                     continue
                 
-                opponents = self._extract_opponents(match_content)
+                opponents = extract_opponents(match_content)
                 if not opponents:
                     logger.warning(f"⚠️ Failed to extract opponents for match {match_id}")
                     continue
                 
                 # Create players and teams
-                team1, team2 = self._create_teams_from_opponents(opponents)
+                team1, team2 = create_teams(opponents)
                 
                 # Handle duplicate match IDs and create final match ID
-                final_match_id = self._generate_final_match_id(tournament, match_id, existing_match_ids, i, team1, team2)
+                final_match_id = generate_final_match_id(tournament, match_id, existing_match_ids, i, team1, team2)
                 
                 # Create unique key to detect true duplicates (same teams, same match)
                 unique_key = f"{team1.name}_vs_{team2.name}_{final_match_id}"
@@ -102,14 +126,14 @@ class DataParser:
                     continue
                 
                 # Create and store match
-                match = self._create_match_from_wikitext(tournament, final_match_id, team1, team2, match_content)
+                match = create_match(tournament, final_match_id, team1, team2, match_content)
                 if match:
                     processed_matches[unique_key] = match
-                    tournament.matches.append(match)
+                    add_match(match)
                     # Add the base match_id to existing_match_ids for Group A/B detection
                     # This ensures second occurrence of M1, M2, etc. will be detected as Group B
                     existing_match_ids.add(match_id)
-                    logger.debug(f"Parsed match {final_match_id}: {team1.name} vs {team2.name}")
+                    logger.debug("Parsed match %s: %s vs %s", final_match_id, team1.name, team2.name)
                 
             except Exception as e:
                 logger.warning(f"⚠️ Failed to parse match {match_id}: {e}")
@@ -118,13 +142,13 @@ class DataParser:
         tournament.players.update(self.players_cache.values())
         tournament.teams.update(self.teams_cache.values())
         
-        logger.debug(f"Parsed {len(tournament.matches)} matches, {len(tournament.players)} players, {len(tournament.teams)} teams")
+        logger.debug("Parsed %d matches, %d players, %d teams",
+                     len(tournament.matches), len(tournament.players), len(tournament.teams))
     
     def _parse_infobox(self, wikitext: str) -> Dict[str, str]:
         """Parse the tournament infobox from wikitext."""
         # Look for infobox pattern - more flexible to handle various formats
-        infobox_pattern = r'\{\{Infobox\s+league\s*\n(.*?)\n\}\}'
-        match = re.search(infobox_pattern, wikitext, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        match = _INFOBOX_RE.search(wikitext)
         
         if not match:
             logger.warning("No infobox found in wikitext")
@@ -142,7 +166,7 @@ class DataParser:
                 if clean_key and clean_value:
                     params[clean_key] = clean_value
         
-        logger.debug(f"Parsed {len(params)} infobox parameters")
+        logger.debug("Parsed %d infobox parameters", len(params))
         return params
     
     def _parse_maps(self, wikitext: str) -> List[str]:
@@ -150,8 +174,7 @@ class DataParser:
         maps = []
         
         # Look for map entries in the infobox
-        map_pattern = r'\|map\d+=([^|\n]+)'
-        map_matches = re.findall(map_pattern, wikitext)
+        map_matches = _INFOBOX_MAP_RE.findall(wikitext)
         
         for map_name in map_matches:
             clean_map = map_name.strip()
@@ -159,7 +182,7 @@ class DataParser:
             if clean_map and not clean_map.startswith('{{') and clean_map not in maps:
                 maps.append(clean_map)
         
-        logger.debug(f"Found {len(maps)} maps: {maps}")
+        logger.debug("Found %d maps: %s", len(maps), maps)
         return maps
     
     def _parse_prize_pool(self, value: str) -> int:
@@ -168,7 +191,7 @@ class DataParser:
             return 0
         
         # Remove currency symbols, commas, and other non-digit characters
-        clean_value = re.sub(r'[^\d]', '', value)
+        clean_value = _NON_DIGIT_RE.sub('', value)
         try:
             return int(clean_value) if clean_value else 0
         except ValueError:
@@ -195,7 +218,7 @@ class DataParser:
     def _get_or_create_player(self, name: str) -> Player:
         """Get existing player or create new one."""
         # Clean up the name (remove any extra formatting)
-        clean_name = re.sub(r'[{}]', '', name).strip()
+        clean_name = _BRACES_RE.sub('', name).strip()
         slug = clean_name.lower().replace(' ', '_')
         
         if slug in self.players_cache:
@@ -258,8 +281,8 @@ class DataParser:
     def _extract_opponents(self, match_content: str) -> tuple:
         """Extract opponent information from match content."""
         # Extract each opponent section separately to handle complex parameter structures
-        opponent1_section = re.search(r'opponent1=\{\{2Opponent\|([^}]+)\}\}', match_content)
-        opponent2_section = re.search(r'opponent2=\{\{2Opponent\|([^}]+)\}\}', match_content)
+        opponent1_section = _OPPONENT1_RE.search(match_content)
+        opponent2_section = _OPPONENT2_RE.search(match_content)
         
         if not opponent1_section or not opponent2_section:
             return None
@@ -268,10 +291,10 @@ class DataParser:
         opp1_content = opponent1_section.group(1)
         opp2_content = opponent2_section.group(1)
         
-        p1_1_match = re.search(r'p1=([^|]+)', opp1_content)
-        p1_2_match = re.search(r'p2=([^|]+)', opp1_content)
-        p2_1_match = re.search(r'p1=([^|]+)', opp2_content)
-        p2_2_match = re.search(r'p2=([^|]+)', opp2_content)
+        p1_1_match = _PLAYER1_RE.search(opp1_content)
+        p1_2_match = _PLAYER2_RE.search(opp1_content)
+        p2_1_match = _PLAYER1_RE.search(opp2_content)
+        p2_2_match = _PLAYER2_RE.search(opp2_content)
         
         if not all([p1_1_match, p1_2_match, p2_1_match, p2_2_match]):
             return None
@@ -308,12 +331,12 @@ class DataParser:
             if match_id in existing_match_ids:
                 # Second occurrence = Group B
                 final_id = f"{base_slug}_B_{match_id}"
-                logger.debug(f"Group B match: {match_id} -> {final_id}")
+                logger.debug("Group B match: %s -> %s", match_id, final_id)
                 return final_id
             else:
                 # First occurrence = Group A
                 final_id = f"{base_slug}_A_{match_id}"
-                logger.debug(f"Group A match: {match_id} -> {final_id}")
+                logger.debug("Group A match: %s -> %s", match_id, final_id)
                 return final_id
         
         # For bracket matches (R1M1, R2M1, etc.), use standard format
@@ -369,11 +392,8 @@ class DataParser:
             elif team1_wins == 0 and team2_wins == 0:
                 # No individual game winners determined (summary scores only)
                 # Extract winner from summary scores
-                score1_pattern = r'opponent1=\{\{2Opponent\|[^}]*?\|score=(\d+)\}\}'
-                score2_pattern = r'opponent2=\{\{2Opponent\|[^}]*?\|score=(\d+)\}\}'
-                
-                score1_match = re.search(score1_pattern, match_content)
-                score2_match = re.search(score2_pattern, match_content)
+                score1_match = _SCORE1_RE.search(match_content)
+                score2_match = _SCORE2_RE.search(match_content)
                 
                 if score1_match and score2_match:
                     try:
@@ -395,18 +415,18 @@ class DataParser:
     
     def _extract_best_of(self, match_content: str) -> int:
         """Extract best of value from match content."""
-        best_of_match = re.search(r'bestof=(\d+)', match_content)
+        best_of_match = _BEST_OF_RE.search(match_content)
         if best_of_match:
             return int(best_of_match.group(1))
         return 3  # Default to best of 3
     
     def _extract_date_from_content(self, match_content: str) -> str:
         """Extract date from match content."""
-        date_match = re.search(r'date=([^|}]+)', match_content)
+        date_match = _DATE_RE.search(match_content)
         if date_match:
             date_str = date_match.group(1)
             # Clean up the date string
-            date_str = re.sub(r'\{\{abbr/[^}]*\}\}', '', date_str).strip()
+            date_str = _ABBR_RE.sub('', date_str).strip()
             return date_str
         return None
     
@@ -423,8 +443,7 @@ class DataParser:
         games = []
         
         # First try to find detailed map entries with individual game results
-        map_pattern = r'map(\d+)=\{\{Map\|[^}]*?map=([^|}]+)[^}]*?\|winner=([^|}]+)[^}]*\}\}'
-        map_matches = re.findall(map_pattern, match_content)
+        map_matches = _GAME_MAP_RE.findall(match_content)
         
         # If we found detailed maps, process them
         if map_matches:
@@ -467,11 +486,8 @@ class DataParser:
             # Fallback: If no detailed maps found, try to create games based on summary scores
             
             # Extract scores from opponent entries
-            score1_pattern = r'opponent1=\{\{2Opponent\|[^}]*?\|score=(\d+)\}\}'
-            score2_pattern = r'opponent2=\{\{2Opponent\|[^}]*?\|score=(\d+)\}\}'
-            
-            score1_match = re.search(score1_pattern, match_content)
-            score2_match = re.search(score2_pattern, match_content)
+            score1_match = _SCORE1_RE.search(match_content)
+            score2_match = _SCORE2_RE.search(match_content)
             
             if score1_match and score2_match:
                 try:
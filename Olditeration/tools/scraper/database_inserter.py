@@ -7,7 +7,11 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Any
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 # Disable verbose httpx logging
@@ -23,78 +27,16 @@ from scraper_config import ScraperConfig
 
 logger = logging.getLogger(__name__)
 
+# Conflict targets used when upserting into each table
+UPSERT_CONFLICT_COLUMNS = {
+    "matches": "match_id",
+    "players": "liquipedia_slug",
+    "teams": "player1_id,player2_id",
+    "tournaments": "liquipedia_slug",
+}
 
-def get_or_create_team_id(team_name: str, player_id_map: Dict[str, str], 
-                         team_id_map: Dict[tuple, str], inserter) -> Optional[str]:
-    """
-    Get or create a team ID for a given team name.
-    Creates missing players automatically.
-    
-    Args:
-        team_name: Team name in format "Player1 + Player2"
-        player_id_map: Mapping of player names to IDs (will be updated)
-        team_id_map: Mapping of (player1, player2) tuples to team IDs
-        inserter: Database inserter instance
-        
-    Returns:
-        Team ID if successful, None otherwise
-    """
-    if not team_name or ' + ' not in team_name:
-        logger.warning(f"Invalid team name format: {team_name}")
-        return None
-    
-    # Parse player names from team name
-    player_names = [name.strip() for name in team_name.split(' + ')]
-    if len(player_names) != 2:
-        logger.warning(f"Expected 2 players in team name, got {len(player_names)}: {team_name}")
-        return None
-    
-    player1_name, player2_name = player_names
-    
-    # Create missing players automatically
-    if player1_name not in player_id_map:
-        try:
-            player_id_map[player1_name] = inserter.insert_player(
-                name=player1_name,
-                liquipedia_slug=player1_name.lower().replace(' ', '_')
-            )
-            logger.debug(f"🆕 Created missing player: {player1_name}")
-        except Exception as e:
-            logger.error(f"Failed to create player {player1_name}: {e}")
-            return None
-            
-    if player2_name not in player_id_map:
-        try:
-            player_id_map[player2_name] = inserter.insert_player(
-                name=player2_name,
-                liquipedia_slug=player2_name.lower().replace(' ', '_')
-            )
-            logger.debug(f"🆕 Created missing player: {player2_name}")
-        except Exception as e:
-            logger.error(f"Failed to create player {player2_name}: {e}")
-            return None
-    
-    # Normalize team key (sort players alphabetically for consistent ordering)
-    normalized_players = sorted([player1_name, player2_name])
-    team_key = (normalized_players[0], normalized_players[1])
-    
-    # Check if team already exists
-    if team_key in team_id_map:
-        return team_id_map[team_key]
-    
-    # Create new team using normalized player order for database consistency
-    try:
-        team_id = inserter.insert_team(
-            name=f"{normalized_players[0]} + {normalized_players[1]}",
-            player1_id=player_id_map[normalized_players[0]],
-            player2_id=player_id_map[normalized_players[1]]
-        )
-        team_id_map[team_key] = team_id
-        logger.debug(f"🆕 Created new team: {normalized_players[0]} + {normalized_players[1]} with ID: {team_id}")
-        return team_id
-    except Exception as e:
-        logger.error(f"Failed to create team {team_name}: {e}")
-        return None
+# Maximum rows sent in a single bulk upsert request
+BULK_CHUNK_SIZE = 500
 
 
 class DatabaseError(Exception):
@@ -108,6 +50,10 @@ class SupabaseDatabaseInserter:
     def __init__(self, config: ScraperConfig):
         self.config = config
         self.client = None
+        self.max_workers = max(1, config.db_max_workers)
+        # Identity caches so rows shared across tournaments are only upserted once
+        self._player_id_cache: Dict[str, str] = {}
+        self._team_id_cache: Dict[tuple, str] = {}
         self.enabled = self._validate_config()
         
         if not self.enabled:
@@ -166,17 +112,7 @@ class SupabaseDatabaseInserter:
             if operation == "insert":
                 response = self.client.table(table).insert(data).execute()
             elif operation == "upsert":
-                # Handle different tables with appropriate conflict resolution
-                if table == "matches":
-                    response = self.client.table(table).upsert(data, on_conflict="match_id").execute()
-                elif table == "players":
-                    response = self.client.table(table).upsert(data, on_conflict="liquipedia_slug").execute()
-                elif table == "teams":
-                    response = self.client.table(table).upsert(data, on_conflict="player1_id,player2_id").execute()
-                elif table == "tournaments":
-                    response = self.client.table(table).upsert(data, on_conflict="liquipedia_slug").execute()
-                else:
-                    response = self.client.table(table).upsert(data).execute()
+                response = self._upsert(table, data)
             else:
                 raise ValueError(f"Unsupported operation: {operation}")
                 
@@ -189,6 +125,111 @@ class SupabaseDatabaseInserter:
             logger.error(f"Database operation error: {e}")
             raise DatabaseError(f"Failed to execute {operation}: {e}")
     
+    def _upsert(self, table: str, data: Any):
+        """Upsert one row or a list of rows using the table's conflict target."""
+        on_conflict = UPSERT_CONFLICT_COLUMNS.get(table)
+        if on_conflict:
+            return self.client.table(table).upsert(data, on_conflict=on_conflict).execute()
+        return self.client.table(table).upsert(data).execute()
+    
+    def _execute_bulk_upsert(self, table: str, rows: List[Dict[str, Any]],
+                             skip_failed_rows: bool = False) -> List[Dict[str, Any]]:
+        """
+        Upsert rows with one request per chunk and return every saved row.
+        
+        With skip_failed_rows, a rejected chunk is retried one row at a time and rows
+        that still fail are logged and left out of the result instead of raising.
+        """
+        if not self.enabled:
+            raise DatabaseError("Database integration disabled")
+        if not self.client:
+            raise DatabaseError("Not connected to database")
+        
+        # A bulk upsert sends the union of its rows' columns and fills gaps with NULL,
+        # so rows are only batched with rows that set exactly the same columns
+        rows_by_columns: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            rows_by_columns.setdefault(frozenset(row), []).append(row)
+        
+        chunks = [column_rows[i:i + BULK_CHUNK_SIZE]
+                  for column_rows in rows_by_columns.values()
+                  for i in range(0, len(column_rows), BULK_CHUNK_SIZE)]
+        chunk_calls = [{'table': table, 'rows': chunk} for chunk in chunks]
+        upsert_fn = self._upsert_chunk_or_rows if skip_failed_rows else self._upsert_chunk
+        chunk_results = self.insert_concurrently(upsert_fn, chunk_calls)
+        
+        saved_rows = [row for chunk_rows in chunk_results for row in chunk_rows]
+        logger.debug(f"Bulk upserted {len(saved_rows)} rows into {table} in {len(chunks)} requests")
+        return saved_rows
+    
+    def _upsert_chunk(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Upsert a single chunk of rows."""
+        try:
+            response = self._upsert(table, rows)
+        except Exception as e:
+            logger.error(f"Database bulk operation error: {e}")
+            raise DatabaseError(f"Failed to bulk upsert into {table}: {e}")
+        
+        if len(response.data or []) != len(rows):
+            raise DatabaseError(f"Bulk upsert into {table} returned {len(response.data or [])} of {len(rows)} rows")
+        return response.data
+    
+    def _upsert_chunk_or_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Upsert a chunk, falling back to per-row upserts so one bad row does not sink the rest."""
+        try:
+            return self._upsert_chunk(table, rows)
+        except DatabaseError as e:
+            if len(rows) == 1:
+                logger.error(f"Skipping row in {table}: {e}")
+                return []
+            logger.warning(f"Retrying {len(rows)} rows for {table} one at a time: {e}")
+        
+        saved_rows = []
+        for row in rows:
+            try:
+                saved_rows.extend(self._upsert_chunk(table, [row]))
+            except DatabaseError as e:
+                logger.error(f"Skipping row in {table}: {e}")
+        return saved_rows
+    
+    def insert_tournaments_bulk(self, tournaments: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Insert or update tournaments in bulk and return mapping of liquipedia_slug -> ID."""
+        # Rows sharing a conflict key cannot be upserted in the same statement
+        rows = list({row["liquipedia_slug"]: row for row in tournaments}.values())
+        saved_rows = self._execute_bulk_upsert("tournaments", rows)
+        return {row["liquipedia_slug"]: str(row["id"]) for row in saved_rows}
+    
+    def insert_players_bulk(self, players: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Insert or update players in bulk and return mapping of liquipedia_slug -> ID."""
+        rows = list({row["liquipedia_slug"]: row for row in players
+                     if row["liquipedia_slug"] not in self._player_id_cache}.values())
+        if rows:
+            saved_rows = self._execute_bulk_upsert("players", rows)
+            self._player_id_cache.update((row["liquipedia_slug"], str(row["id"])) for row in saved_rows)
+        return {row["liquipedia_slug"]: self._player_id_cache[row["liquipedia_slug"]] for row in players}
+    
+    def insert_teams_bulk(self, teams: List[Dict[str, Any]]) -> Dict[tuple, str]:
+        """Insert or update teams in bulk and return mapping of (player1_id, player2_id) -> ID."""
+        rows = list({(row["player1_id"], row["player2_id"]): row for row in teams
+                     if (row["player1_id"], row["player2_id"]) not in self._team_id_cache}.values())
+        if rows:
+            saved_rows = self._execute_bulk_upsert("teams", rows)
+            self._team_id_cache.update(((str(row["player1_id"]), str(row["player2_id"])), str(row["id"]))
+                                       for row in saved_rows)
+        return {(row["player1_id"], row["player2_id"]): self._team_id_cache[(row["player1_id"], row["player2_id"])]
+                for row in teams}
+    
+    def insert_matches_bulk(self, matches: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Insert or update matches in bulk and return mapping of match_id -> database ID for saved matches."""
+        rows = list({row["match_id"]: row for row in matches}.values())
+        saved_rows = self._execute_bulk_upsert("matches", rows, skip_failed_rows=True)
+        return {row["match_id"]: str(row["id"]) for row in saved_rows}
+    
+    def insert_games_bulk(self, games: List[Dict[str, Any]]) -> List[str]:
+        """Insert games in bulk and return the IDs of the saved games."""
+        saved_rows = self._execute_bulk_upsert("games", games, skip_failed_rows=True)
+        return [str(row["id"]) for row in saved_rows]
+    
     def insert_player(self, name: str, liquipedia_slug: str, 
                      nationality: Optional[str] = None, 
                      preferred_race: Optional[str] = None) -> str:
@@ -196,6 +237,9 @@ class SupabaseDatabaseInserter:
         if not self.enabled:
             raise DatabaseError("Database integration disabled")
         
+        if liquipedia_slug in self._player_id_cache:
+            return self._player_id_cache[liquipedia_slug]
+        
         data = {
             "liquipedia_slug": liquipedia_slug,
             "name": name,
@@ -206,6 +250,7 @@ class SupabaseDatabaseInserter:
         try:
             result = self._execute_query("players", "upsert", data)
             player_id = str(result["id"])
+            self._player_id_cache[liquipedia_slug] = player_id
             logger.debug(f"Player '{name}' saved with ID: {player_id}")
             return player_id
         except Exception as e:
@@ -216,6 +261,9 @@ class SupabaseDatabaseInserter:
         if not self.enabled:
             raise DatabaseError("Database integration disabled")
         
+        if (player1_id, player2_id) in self._team_id_cache:
+            return self._team_id_cache[(player1_id, player2_id)]
+        
         data = {
             "name": name,
             "player1_id": player1_id,
@@ -225,6 +273,7 @@ class SupabaseDatabaseInserter:
         try:
             result = self._execute_query("teams", "upsert", data)
             team_id = str(result["id"])
+            self._team_id_cache[(player1_id, player2_id)] = team_id
             logger.debug(f"Team '{name}' saved with ID: {team_id}")
             return team_id
         except Exception as e:
@@ -303,6 +352,20 @@ class SupabaseDatabaseInserter:
         except Exception as e:
             raise DatabaseError(f"Failed to insert game: {map_name} - {e}")
     
+    def insert_concurrently(self, insert_fn: Callable[..., Any],
+                            calls: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Run independent insert calls concurrently and return their results in call order.
+        
+        Each Supabase request is a blocking HTTP round trip, so overlapping them
+        hides the network latency that otherwise dominates insertion time.
+        """
+        if len(calls) <= 1 or self.max_workers == 1:
+            return [insert_fn(**kwargs) for kwargs in calls]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as executor:
+            return list(executor.map(lambda kwargs: insert_fn(**kwargs), calls))
+    
     def test_connection(self) -> bool:
         """Test database connection."""
         if not self.enabled:
@@ -317,6 +380,67 @@ class SupabaseDatabaseInserter:
             return False
 
 
+class TournamentDatabaseWriter:
+    """
+    Writes scraped tournaments to the database on a background thread.
+    
+    Tournaments are submitted as soon as they are parsed, so database writes overlap
+    with the remaining Liquipedia fetches. A single consumer thread drains the queue,
+    which keeps writes in submission order.
+    """
+    
+    def __init__(self, config: ScraperConfig):
+        self.inserter = SupabaseDatabaseInserter(config)
+        self.success = True
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> bool:
+        """Connect to the database and start the writer thread."""
+        if not self.inserter.enabled:
+            logger.warning("Database insertion skipped - not configured")
+            return False
+        
+        try:
+            self.inserter.connect()
+            if not self.inserter.test_connection():
+                logger.error("Database connection test failed")
+                self.inserter.disconnect()
+                return False
+        except Exception as e:
+            logger.error(f"Database insertion failed: {e}")
+            return False
+        
+        self._thread = threading.Thread(target=self._run, name="tournament-db-writer", daemon=True)
+        self._thread.start()
+        return True
+    
+    def submit(self, tournament_data: dict) -> None:
+        """Queue a single tournament's data for insertion."""
+        self._queue.put(tournament_data)
+    
+    def close(self) -> bool:
+        """Wait for queued tournaments to be written and disconnect. Returns overall success."""
+        if self._thread is None:
+            return False
+        
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.inserter.disconnect()
+        return self.success
+    
+    def _run(self) -> None:
+        """Drain the queue until the shutdown sentinel arrives."""
+        while True:
+            tournament_data = self._queue.get()
+            if tournament_data is None:
+                break
+            
+            if not _process_tournament_data(self.inserter, tournament_data):
+                self.success = False
+
+
 def insert_tournament_data(json_file_path: str, config: ScraperConfig) -> bool:
     """
     Main function to read JSON data and insert it into the database.
@@ -365,13 +489,16 @@ def _process_tournament_data(inserter: SupabaseDatabaseInserter, tournament_data
         tournament_id_map = _insert_tournaments(inserter, tournament_data)
         default_tournament_id = list(tournament_id_map.values())[0] if tournament_id_map else None
         
+        # Collect players, teams and matches in a single pass
+        pending_players, pending_teams, pending_matches = _collect_pending_rows(tournament_data)
+        
         # Insert players and teams
-        player_id_map = _insert_players(inserter, tournament_data)
-        team_id_map = _insert_teams(inserter, tournament_data, player_id_map)
+        player_id_map = _insert_players(inserter, pending_players)
+        team_id_map = _insert_teams(inserter, pending_teams, player_id_map)
         
         # Insert matches and games
-        _insert_matches_and_games(inserter, tournament_data, tournament_id_map, 
-                                 default_tournament_id, player_id_map, team_id_map)
+        _insert_matches_and_games(inserter, pending_matches, tournament_id_map, 
+                                 default_tournament_id, team_id_map)
         
         logger.info("Tournament data successfully inserted into database")
         return True
@@ -381,6 +508,17 @@ def _process_tournament_data(inserter: SupabaseDatabaseInserter, tournament_data
         return False
 
 
+def _with_optional_fields(row: Dict[str, Any], **optional_fields) -> Dict[str, Any]:
+    """
+    Add the optional fields that have a value to a row.
+    
+    None values are left out so an upsert keeps the stored value (or the column
+    default on insert) instead of overwriting it with NULL.
+    """
+    row.update((field, value) for field, value in optional_fields.items() if value is not None)
+    return row
+
+
 def _insert_tournaments(inserter: SupabaseDatabaseInserter, tournament_data: dict) -> dict:
     """Insert tournaments and return mapping of slug -> id."""
     tournaments_list = tournament_data.get('tournaments', [])
@@ -390,110 +528,172 @@ def _insert_tournaments(inserter: SupabaseDatabaseInserter, tournament_data: dic
     if single_tournament and not tournaments_list:
         tournaments_list = [single_tournament]
     
-    tournament_id_map = {}
-    for tournament_info in tournaments_list:
-        tournament_id = inserter.insert_tournament(
-            name=tournament_info.get('name', 'Unknown Tournament'),
-            liquipedia_slug=tournament_info.get('liquipedia_slug', 'unknown'),
+    tournament_rows = [
+        _with_optional_fields(
+            {
+                'name': tournament_info.get('name', 'Unknown Tournament'),
+                'liquipedia_slug': tournament_info.get('liquipedia_slug', 'unknown')
+            },
             start_date=tournament_info.get('start_date'),
             end_date=tournament_info.get('end_date'),
             prize_pool=tournament_info.get('prize_pool'),
             location=tournament_info.get('location'),
             status=tournament_info.get('status', 'completed')
         )
-        tournament_id_map[tournament_info.get('liquipedia_slug', 'unknown')] = tournament_id
+        for tournament_info in tournaments_list
+    ]
     
-    return tournament_id_map
+    return inserter.insert_tournaments_bulk(tournament_rows)
 
 
-def _insert_players(inserter: SupabaseDatabaseInserter, tournament_data: dict) -> dict:
-    """Insert players and return mapping of name -> id."""
-    players_data = tournament_data.get('players', [])
-    logger.info(f"Processing {len(players_data)} players")
+@lru_cache(maxsize=8192)
+def _split_team_name(team_name: str) -> Optional[tuple]:
+    """
+    Split a "Player1 + Player2" team name into an alphabetically sorted player pair.
     
-    player_id_map = {}
-    for player in players_data:
-        player_name = player.get('name', '')
-        if player_name and player_name not in player_id_map:
-            player_id = inserter.insert_player(
-                name=player_name,
-                liquipedia_slug=player.get('liquipedia_slug', player_name.lower().replace(' ', '_')),
-                nationality=player.get('nationality'),
-                preferred_race=player.get('preferred_race')
-            )
-            player_id_map[player_name] = player_id
+    Memoized because every match repeats its teams' names.
+    """
+    if not team_name or ' + ' not in team_name:
+        return None
+    
+    player_names = [name.strip() for name in team_name.split(' + ')]
+    if len(player_names) != 2:
+        return None
     
-    return player_id_map
+    return tuple(sorted(player_names))
 
 
-def _insert_teams(inserter: SupabaseDatabaseInserter, tournament_data: dict, player_id_map: dict) -> dict:
-    """Insert teams and return mapping of (player1, player2) -> id."""
-    teams_data = tournament_data.get('teams', [])
-    logger.info(f"Pre-processing {len(teams_data)} teams")
-    
-    team_id_map = {}
-    for team in teams_data:
-        team_name = team.get('name', '')
-        if team_name:
-            get_or_create_team_id(team_name, player_id_map, team_id_map, inserter)
+def _collect_pending_rows(tournament_data: dict) -> tuple:
+    """
+    Walk the players, teams and matches once and collect everything to insert.
     
-    return team_id_map
+    Returns:
+        Tuple of (player rows by name, team keys, (match, team1_key, team2_key) list).
+        Players only referenced by team names are included with default fields.
+    """
+    pending_players = {}
+    for player in tournament_data.get('players', []):
+        player_name = player.get('name', '')
+        if player_name and player_name not in pending_players:
+            pending_players[player_name] = {
+                'name': player_name,
+                'liquipedia_slug': player.get('liquipedia_slug', player_name.lower().replace(' ', '_')),
+                'nationality': player.get('nationality'),
+                'preferred_race': player.get('preferred_race')
+            }
+    
+    # Ordered set of (player1, player2) keys
+    pending_teams = {}
+    
+    def add_team(team_name: str) -> Optional[tuple]:
+        team_key = _split_team_name(team_name)
+        if team_key and team_key not in pending_teams:
+            pending_teams[team_key] = None
+            for player_name in team_key:
+                if player_name not in pending_players:
+                    pending_players[player_name] = {
+                        'name': player_name,
+                        'liquipedia_slug': player_name.lower().replace(' ', '_'),
+                        'nationality': None,
+                        'preferred_race': None
+                    }
+        return team_key
+    
+    for team in tournament_data.get('teams', []):
+        add_team(team.get('name', ''))
+    
+    pending_matches = [
+        (match, add_team(match.get('team1_name', '')), add_team(match.get('team2_name', '')))
+        for match in tournament_data.get('matches', [])
+    ]
+    
+    return pending_players, list(pending_teams), pending_matches
+
+
+def _insert_players(inserter: SupabaseDatabaseInserter, pending_players: dict) -> dict:
+    """Insert players and return mapping of name -> id."""
+    logger.info(f"Processing {len(pending_players)} players")
+    player_ids = inserter.insert_players_bulk(list(pending_players.values()))
+    return {name: player_ids[row['liquipedia_slug']] for name, row in pending_players.items()}
 
 
-def _insert_matches_and_games(inserter: SupabaseDatabaseInserter, tournament_data: dict,
-                             tournament_id_map: dict, default_tournament_id: str,
-                             player_id_map: dict, team_id_map: dict) -> None:
-    """Insert matches and their associated games."""
-    matches_data = tournament_data.get('matches', [])
-    logger.info(f"Processing {len(matches_data)} matches")
+def _insert_teams(inserter: SupabaseDatabaseInserter, pending_teams: list, player_id_map: dict) -> dict:
+    """Insert teams and return mapping of (player1, player2) -> id."""
+    logger.info(f"Processing {len(pending_teams)} teams")
+    team_rows = [
+        {
+            'name': f"{team_key[0]} + {team_key[1]}",
+            'player1_id': player_id_map[team_key[0]],
+            'player2_id': player_id_map[team_key[1]]
+        }
+        for team_key in pending_teams
+    ]
     
-    for match in matches_data:
-        try:
-            _insert_single_match(inserter, match, tournament_id_map, default_tournament_id,
-                               player_id_map, team_id_map)
-        except Exception as e:
-            logger.error(f"Error processing match {match.get('match_id', 'unknown')}: {e}")
+    team_ids = inserter.insert_teams_bulk(team_rows)
+    return {team_key: team_ids[(row['player1_id'], row['player2_id'])]
+            for team_key, row in zip(pending_teams, team_rows)}
 
 
-def _insert_single_match(inserter: SupabaseDatabaseInserter, match: dict,
-                        tournament_id_map: dict, default_tournament_id: str,
-                        player_id_map: dict, team_id_map: dict) -> None:
-    """Insert a single match and its games."""
-    team1_name = match.get('team1_name', '')
-    team2_name = match.get('team2_name', '')
-    
-    team1_id = get_or_create_team_id(team1_name, player_id_map, team_id_map, inserter)
-    team2_id = get_or_create_team_id(team2_name, player_id_map, team_id_map, inserter)
-    
-    if not (team1_id and team2_id):
-        logger.warning(f"Could not find team IDs for match: {team1_name} vs {team2_name}")
-        return
-    
-    # Determine tournament and winner
-    match_tournament_slug = match.get('tournament_slug', '')
-    match_tournament_id = tournament_id_map.get(match_tournament_slug, default_tournament_id)
-    
-    if not match_tournament_id:
-        logger.warning(f"No tournament found for match {match.get('match_id', 'unknown')}")
-        return
-    
-    winner_id = _determine_winner_id(match, team1_name, team2_name, team1_id, team2_id)
-    
-    # Insert match
-    match_db_id = inserter.insert_match(
-        tournament_id=match_tournament_id,
-        match_id=match.get('match_id', f"match_{hash(str(match))}"),
-        team1_id=team1_id,
-        team2_id=team2_id,
-        best_of=match.get('best_of'),
-        winner_id=winner_id,
-        status=match.get('status', 'completed'),
-        team1_score=match.get('team1_score', 0),
-        team2_score=match.get('team2_score', 0)
-    )
+def _insert_matches_and_games(inserter: SupabaseDatabaseInserter, pending_matches: list,
+                             tournament_id_map: dict, default_tournament_id: str,
+                             team_id_map: dict) -> None:
+    """
+    Insert all matches in bulk, then all of their games in bulk.
     
-    # Insert games
-    _insert_match_games(inserter, match, match_db_id, team1_name, team2_name, team1_id, team2_id)
+    Matches or games the database rejects are logged and skipped, as are the
+    games of a rejected match.
+    """
+    logger.info(f"Processing {len(pending_matches)} matches")
+    
+    match_rows = []
+    match_teams = {}
+    get_team_id = team_id_map.get
+    get_tournament_id = tournament_id_map.get
+    for match, team1_key, team2_key in pending_matches:
+        team1_name = match.get('team1_name', '')
+        team2_name = match.get('team2_name', '')
+        team1_id = get_team_id(team1_key)
+        team2_id = get_team_id(team2_key)
+        
+        if not (team1_id and team2_id):
+            logger.warning(f"Could not find team IDs for match: {team1_name} vs {team2_name}")
+            continue
+        
+        # Determine tournament and winner
+        match_tournament_slug = match.get('tournament_slug', '')
+        match_tournament_id = get_tournament_id(match_tournament_slug, default_tournament_id)
+        
+        if not match_tournament_id:
+            logger.warning(f"No tournament found for match {match.get('match_id', 'unknown')}")
+            continue
+        
+        match_id = match.get('match_id', f"match_{hash(str(match))}")
+        match_rows.append(_with_optional_fields(
+            {
+                'tournament_id': match_tournament_id,
+                'match_id': match_id,
+                'team1_id': team1_id,
+                'team2_id': team2_id
+            },
+            best_of=match.get('best_of'),
+            winner_id=_determine_winner_id(match, team1_name, team2_name, team1_id, team2_id),
+            status=match.get('status', 'completed'),
+            team1_score=match.get('team1_score', 0),
+            team2_score=match.get('team2_score', 0)
+        ))
+        match_teams[match_id] = (match, team1_name, team2_name, team1_id, team2_id)
+    
+    match_db_ids = inserter.insert_matches_bulk(match_rows)
+    
+    game_rows = []
+    for match_id, (match, team1_name, team2_name, team1_id, team2_id) in match_teams.items():
+        match_db_id = match_db_ids.get(match_id)
+        if match_db_id is None:
+            continue
+        game_rows.extend(_build_game_rows(match, match_db_id,
+                                          team1_name, team2_name, team1_id, team2_id))
+    
+    inserter.insert_games_bulk(game_rows)
 
 
 def _determine_winner_id(match: dict, team1_name: str, team2_name: str, team1_id: str, team2_id: str) -> Optional[str]:
@@ -506,20 +706,21 @@ def _determine_winner_id(match: dict, team1_name: str, team2_name: str, team1_id
     return None
 
 
-def _insert_match_games(inserter: SupabaseDatabaseInserter, match: dict, match_db_id: str,
-                       team1_name: str, team2_name: str, team1_id: str, team2_id: str) -> None:
-    """Insert all games for a match."""
-    games = match.get('games', [])
-    for game in games:
-        game_winner_id = _determine_winner_id(game, team1_name, team2_name, team1_id, team2_id)
-        
-        inserter.insert_game(
-            match_db_id=match_db_id,
-            game_number=game.get('game_number', 1),
-            map_name=game.get('map_name', 'Unknown Map'),
-            winner_id=game_winner_id,
+def _build_game_rows(match: dict, match_db_id: str, team1_name: str, team2_name: str,
+                     team1_id: str, team2_id: str) -> List[Dict[str, Any]]:
+    """Build database rows for all games of a match."""
+    return [
+        _with_optional_fields(
+            {
+                'match_id': match_db_id,
+                'game_number': game.get('game_number', 1),
+                'map_name': game.get('map_name', 'Unknown Map')
+            },
+            winner_id=_determine_winner_id(game, team1_name, team2_name, team1_id, team2_id),
             duration_seconds=game.get('duration_seconds')
         )
+        for game in match.get('games', [])
+    ]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""
+JSON helpers shared by the SC2 Stats scraper modules.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json_file(path: Path) -> Any:
+    """Load a JSON file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with path.open('r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(path: Path, data: Any) -> None:
+    """Write compact JSON to a file, serializing unknown types with str()."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, default=str))
+    else:
+        with path.open('w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+
+
+def dump_json_bytes(value: Any) -> bytes:
+    """Serialize a value as indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str).encode('utf-8')
@@ -7,19 +7,31 @@ from __future__ import annotations
 import json
 import time
 import logging
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception, wait_exponential_jitter
+from urllib3.util.retry import Retry
 from cachetools import TTLCache  # pyright: ignore[reportMissingModuleSource]
 
+from json_utils import read_json_file, write_json_file
 from scraper_config import ScraperConfig
 
 logger = logging.getLogger(__name__)
 
+# Pause applied to all requests after a 429 without a usable Retry-After header
+RATE_LIMIT_BACKOFF = 5.0
+
+# Maximum titles per MediaWiki query for non-bot accounts
+PAGES_PER_REQUEST = 50
+
 
 class LiquipediaApiError(Exception):
     """Base exception for Liquipedia API errors."""
@@ -31,6 +43,101 @@ class RateLimitError(LiquipediaApiError):
     pass
 
 
+def _is_retryable_error(error: BaseException) -> bool:
+    """Retry transient failures; client errors such as 404 will not succeed on retry."""
+    if isinstance(error, requests.HTTPError):
+        return False
+    return isinstance(error, (requests.RequestException, LiquipediaApiError))
+
+
+def _stop_after_configured_retries(retry_state) -> bool:
+    """Stop retrying once the client's configured max_retries attempts are used up."""
+    client = retry_state.args[0]
+    return retry_state.attempt_number >= max(1, client.config.max_retries)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _get_first_page_content(data: Dict[str, Any]) -> Optional[str]:
+    """Get the wikitext of the first page in a revisions query response."""
+    for page_data in data.get("query", {}).get("pages", {}).values():
+        revisions = page_data.get("revisions", [])
+        if revisions:
+            return revisions[0].get("*", "")
+    return None
+
+
+def _get_first_revision_id(data: Dict[str, Any]) -> Optional[int]:
+    """Get the revision ID of the first page in a revisions query response."""
+    for page_data in data.get("query", {}).get("pages", {}).values():
+        revisions = page_data.get("revisions", [])
+        if revisions:
+            return revisions[0].get("revid")
+    return None
+
+
+class RateLimiter:
+    """
+    Thread-safe request pacing shared by every fetch worker.
+    
+    Request starts are spaced at least ``min_interval`` seconds apart, and the server's
+    rate limit headers can push the next allowed start further out for all workers.
+    """
+    
+    def __init__(self, min_interval: float):
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._next_request_time = 0.0
+    
+    def acquire(self):
+        """Block until the next request may start."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.min_interval
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def defer(self, seconds: float):
+        """Hold back every request for at least the given number of seconds."""
+        with self._lock:
+            self._next_request_time = max(self._next_request_time, time.monotonic() + seconds)
+    
+    def update_from_headers(self, headers) -> None:
+        """Pause all requests when the server reports the rate limit as exhausted."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            if int(remaining) > 0:
+                return
+            reset_seconds = float(reset)
+        except ValueError:
+            return
+        
+        # Reset is either a delay in seconds or an absolute epoch timestamp
+        if reset_seconds > 1_000_000_000:
+            reset_seconds -= time.time()
+        logger.debug("Rate limit exhausted, pausing requests for %.1fs", reset_seconds)
+        self.defer(max(0.0, reset_seconds))
+
+
 class LiquipediaClient:
     """Unified client for Liquipedia MediaWiki and LPDB APIs."""
     
@@ -38,6 +145,16 @@ class LiquipediaClient:
         self.config = config
         self.session = requests.Session()
         
+        # Keep enough pooled keep-alive connections for every concurrent fetch worker.
+        # Only failures to open a new connection are retried at the socket level. Read
+        # errors (timeouts, a dropped keep-alive socket) are re-raised unchanged and, like
+        # HTTP status errors, left to _make_request and its tenacity retry.
+        pool_size = max(1, config.max_workers)
+        connect_retry = Retry(total=2, connect=2, read=False, status=0, other=0, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=connect_retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
         # Set up session headers
         self.session.headers.update({
             "User-Agent": config.user_agent,
@@ -52,6 +169,10 @@ class LiquipediaClient:
             })
             logger.info("Using authenticated Liquipedia access")
         
+        # Rate limiting is shared across threads so concurrent fetches stay within limits
+        self.rate_limiter = RateLimiter(config.rate_limit_delay)
+        self._cache_lock = threading.Lock()
+        
         # Initialize caches
         if config.enable_cache:
             self.memory_cache = TTLCache(maxsize=100, ttl=config.cache_ttl)
@@ -60,7 +181,17 @@ class LiquipediaClient:
             self.memory_cache = None
             self.file_cache_dir = None
             
-        logger.debug(f"Initialized Liquipedia client with cache: {config.enable_cache}")
+        logger.debug("Initialized Liquipedia client with cache: %s", config.enable_cache)
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> LiquipediaClient:
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _get_cache_key(self, method: str, params: Dict[str, Any]) -> str:
         """Generate cache key for request parameters."""
@@ -81,28 +212,34 @@ class LiquipediaClient:
             return None
         
         # Check memory cache first
-        if self.memory_cache and cache_key in self.memory_cache:
-            logger.debug(f"Memory cache hit: {cache_key}")
-            return self.memory_cache[cache_key]
+        if self.memory_cache is not None:
+            with self._cache_lock:
+                cached = self.memory_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Memory cache hit: %s", cache_key)
+                return cached
         
         # Check file cache
         cache_file = self._get_file_cache_path(cache_key)
         if cache_file.exists():
             try:
-                with cache_file.open('r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_json_file(cache_file)
                 
                 # Check if cache is still valid
                 cached_time = datetime.fromisoformat(data.get('cached_at', '1970-01-01'))
                 if datetime.now() - cached_time < timedelta(seconds=self.config.cache_ttl):
-                    logger.debug(f"File cache hit: {cache_key}")
+                    logger.debug("File cache hit: %s", cache_key)
                     # Put back in memory cache
-                    if self.memory_cache:
-                        self.memory_cache[cache_key] = data['content']
+                    if self.memory_cache is not None:
+                        with self._cache_lock:
+                            self.memory_cache[cache_key] = data['content']
                     return data['content']
                 else:
-                    logger.debug(f"Cache expired: {cache_key}")
-                    cache_file.unlink()  # Remove expired cache
+                    logger.debug("Cache expired: %s", cache_key)
+                    # Only page content entries carry a revision ID to revalidate against;
+                    # keep those on disk and drop everything else
+                    if _get_first_revision_id(data['content']) is None:
+                        cache_file.unlink()
             except Exception as e:
                 logger.warning(f"Failed to read cache {cache_key}: {e}")
                 if cache_file.exists():
@@ -110,14 +247,30 @@ class LiquipediaClient:
         
         return None
     
+    def _get_stale_cached_data(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get data from the file cache regardless of its age."""
+        if not self.config.enable_cache:
+            return None
+        
+        cache_file = self._get_file_cache_path(cache_key)
+        if not cache_file.exists():
+            return None
+        
+        try:
+            return read_json_file(cache_file)['content']
+        except Exception as e:
+            logger.warning(f"Failed to read cache {cache_key}: {e}")
+            return None
+    
     def _cache_data(self, cache_key: str, data: Dict[str, Any]):
         """Cache data to both memory and file."""
         if not self.config.enable_cache:
             return
         
         # Store in memory cache
-        if self.memory_cache:
-            self.memory_cache[cache_key] = data
+        if self.memory_cache is not None:
+            with self._cache_lock:
+                self.memory_cache[cache_key] = data
         
         # Store in file cache
         try:
@@ -126,30 +279,28 @@ class LiquipediaClient:
                 'content': data,
                 'cached_at': datetime.now().isoformat()
             }
-            with cache_file.open('w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"Cached data: {cache_key}")
+            write_json_file(cache_file, cache_data)
+            logger.debug("Cached data: %s", cache_key)
         except Exception as e:
             logger.warning(f"Failed to cache data {cache_key}: {e}")
     
     @retry(
         reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((requests.RequestException, LiquipediaApiError)),
+        stop=_stop_after_configured_retries,
+        wait=wait_exponential_jitter(initial=0.5, max=10),
+        retry=retry_if_exception(_is_retryable_error),
     )
-    def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _make_request(self, params: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
         """Make a request to the Liquipedia API with retry logic."""
         cache_key = self._get_cache_key("api_request", params)
         
         # Check cache first
-        cached_data = self._get_cached_data(cache_key)
+        cached_data = self._get_cached_data(cache_key) if use_cache else None
         if cached_data:
             return cached_data
         
         # Add rate limiting
-        if self.config.rate_limit_delay > 0:
-            time.sleep(self.config.rate_limit_delay)
+        self.rate_limiter.acquire()
         
         # Make the request with extended timeout for connection issues
         try:
@@ -165,11 +316,18 @@ class LiquipediaClient:
             logger.warning("Read timeout from Liquipedia, retrying...")
             raise LiquipediaApiError("Read timeout from Liquipedia")
         
+        self.rate_limiter.update_from_headers(response.headers)
+        
         if response.status_code == 429:
-            logger.warning("Rate limited by Liquipedia (429)")
-            time.sleep(5)  # Additional backoff for rate limits
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            backoff = RATE_LIMIT_BACKOFF if retry_after is None else retry_after
+            logger.warning(f"Rate limited by Liquipedia (429), pausing requests for {backoff:.1f}s")
+            self.rate_limiter.defer(backoff)
             raise RateLimitError("Rate limited by Liquipedia (429)")
         
+        if response.status_code >= 500:
+            raise LiquipediaApiError(f"Liquipedia server error ({response.status_code})")
+        
         response.raise_for_status()
         data = response.json()
         
@@ -177,20 +335,35 @@ class LiquipediaClient:
             raise LiquipediaApiError(str(data["error"]))
         
         # Cache successful response
-        self._cache_data(cache_key, data)
+        if use_cache:
+            self._cache_data(cache_key, data)
         return data
     
+    def _get_page_cache_key(self, title: str) -> str:
+        """Get the cache key of a single page's content query."""
+        params = {
+            "action": "query",
+            "format": "json",
+            "prop": "revisions",
+            "rvprop": "content|ids",
+            "titles": title,
+        }
+        return self._get_cache_key("api_request", params)
+    
     def get_page_content(self, title: str) -> Optional[str]:
         """Get the raw wikitext content of a page."""
         params = {
             "action": "query",
             "format": "json",
             "prop": "revisions",
-            "rvprop": "content",
+            "rvprop": "content|ids",
             "titles": title,
         }
         
-        data = self._make_request(params)
+        cache_key = self._get_page_cache_key(title)
+        data = self._get_cached_data(cache_key) or self._revalidate_cached_page(title, cache_key)
+        if data is None:
+            data = self._make_request(params)
         pages = data.get("query", {}).get("pages", {})
         
         for page_id, page_data in pages.items():
@@ -202,6 +375,135 @@ class LiquipediaClient:
         logger.warning(f"Page not found: {title}")
         return None
     
+    def _revalidate_cached_page(self, title: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Reuse an expired cached page if its revision is unchanged.
+        
+        Only the page's current revision ID is requested, so an unchanged page costs
+        a tiny response instead of a full wikitext download.
+        """
+        stale_data = self._get_stale_cached_data(cache_key)
+        cached_revid = _get_first_revision_id(stale_data) if stale_data else None
+        if cached_revid is None:
+            return None
+        
+        params = {
+            "action": "query",
+            "format": "json",
+            "prop": "revisions",
+            "rvprop": "ids",
+            "titles": title,
+        }
+        if _get_first_revision_id(self._make_request(params, use_cache=False)) != cached_revid:
+            return None
+        
+        logger.debug("Page unchanged since cached revision %s: %s", cached_revid, title)
+        self._cache_data(cache_key, stale_data)
+        return stale_data
+    
+    def get_pages_content(self, titles: List[str]) -> Dict[str, str]:
+        """
+        Get the raw wikitext content of several pages with one request per batch of titles.
+        
+        Batches are fetched concurrently. A failed batch is logged and its pages are left
+        out, like missing pages.
+        
+        Returns:
+            Mapping of requested title -> wikitext for every page that was found
+        """
+        batches = [titles[i:i + PAGES_PER_REQUEST] for i in range(0, len(titles), PAGES_PER_REQUEST)]
+        if not batches:
+            return {}
+        
+        contents = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.config.max_workers, len(batches)))) as executor:
+            futures = [executor.submit(self._get_pages_content_batch, batch) for batch in batches]
+            for batch, future in zip(batches, futures):
+                try:
+                    contents.update(future.result())
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {len(batch)} pages starting at {batch[0]}: {e}")
+        return contents
+    
+    def _get_pages_content_batch(self, titles: List[str]) -> Dict[str, str]:
+        """
+        Fetch the wikitext of up to PAGES_PER_REQUEST pages, reusing cached pages.
+        
+        Pages are cached one title at a time under the same key as get_page_content.
+        Expired pages are revalidated together with a single revision ID query, and
+        only new or changed pages are downloaded, again in a single query.
+        """
+        cache_keys = {title: self._get_page_cache_key(title) for title in titles}
+        contents = {}
+        stale_pages = {}
+        pending_titles = []
+        for title, cache_key in cache_keys.items():
+            data = self._get_cached_data(cache_key)
+            if data is not None:
+                content = _get_first_page_content(data)
+                if content is not None:
+                    contents[title] = content
+                continue
+            
+            stale_data = self._get_stale_cached_data(cache_key)
+            if stale_data and _get_first_revision_id(stale_data) is not None:
+                stale_pages[title] = stale_data
+            else:
+                pending_titles.append(title)
+        
+        if stale_pages:
+            current_revids = {
+                title: page_data["revisions"][0].get("revid")
+                for title, page_data in self._query_pages(list(stale_pages), "ids")
+                if page_data.get("revisions")
+            }
+            for title, stale_data in stale_pages.items():
+                if current_revids.get(title) == _get_first_revision_id(stale_data):
+                    self._cache_data(cache_keys[title], stale_data)
+                    contents[title] = _get_first_page_content(stale_data)
+                else:
+                    pending_titles.append(title)
+            logger.debug("Revalidated %d expired pages, %d still current",
+                         len(stale_pages), len(stale_pages) - len(set(pending_titles) & stale_pages.keys()))
+        
+        if pending_titles:
+            for title, page_data in self._query_pages(pending_titles, "content|ids"):
+                revisions = page_data.get("revisions", [])
+                if revisions:
+                    contents[title] = revisions[0].get("*", "")
+                elif "missing" not in page_data:
+                    continue  # Content follows in a continuation response
+                # Stored in the shape of a single-title response, where a missing page is "-1"
+                page_id = str(page_data["pageid"]) if revisions and "pageid" in page_data else "-1"
+                self._cache_data(cache_keys[title], {"query": {"pages": {page_id: page_data}}})
+        
+        return contents
+    
+    def _query_pages(self, titles: List[str], rvprop: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Run an uncached revisions query for several titles, yielding (requested title, page data)."""
+        params = {
+            "action": "query",
+            "format": "json",
+            "prop": "revisions",
+            "rvprop": rvprop,
+            "titles": "|".join(titles),
+        }
+        
+        while True:
+            data = self._make_request(params, use_cache=False)
+            query = data.get("query", {})
+            
+            # Map normalized titles (e.g. underscores -> spaces) back to the requested ones
+            requested_titles = {entry["to"]: entry["from"] for entry in query.get("normalized", [])}
+            for page_data in query.get("pages", {}).values():
+                title = page_data.get("title", "")
+                yield requested_titles.get(title, title), page_data
+            
+            # Content that does not fit in one response is returned through continuation
+            if "continue" not in data:
+                return
+            params = {**params, **data["continue"]}
+    
     def search_pages(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Search for pages matching a query."""
         params = {
@@ -248,7 +550,7 @@ class LiquipediaClient:
                 break
             
             offset += batch_size
-            logger.debug(f"Retrieved {len(results)} records from {table}")
+            logger.debug("Retrieved %d records from %s", len(results), table)
         
         logger.info(f"Retrieved {len(results)} total records from {table}")
         return results
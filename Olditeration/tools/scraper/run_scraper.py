@@ -7,6 +7,7 @@ This can be called from the web interface or run manually.
 
 import sys
 import os
+from pathlib import Path
 
 # Set UTF-8 encoding for stdout
 import codecs
@@ -19,28 +20,28 @@ if sys.stderr.encoding != 'utf-8':
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from scraper import SC2Scraper
-from scraper_config import config
+from scraper_config import get_config
 
 def main():
     """Main function to run the scraper."""
     print("Starting SC2 Tournament Scraper...")
+    config = get_config()
     
     try:
-        scraper = SC2Scraper(config)
-        
         # Default tournament to scrape
         tournament_series = "UThermal_2v2_Circuit"
         
         print(f"Scraping tournament series: {tournament_series}")
         
-        # Find subevents and scrape them
-        subevents = scraper.find_subevents(tournament_series)
-        target_tournaments = [f"{tournament_series}/{subevent}" for subevent in subevents]
-        
-        print(f"Found {len(target_tournaments)} tournaments to scrape")
-        
-        # Run the scraper
-        combined_data = scraper.scrape_multiple_tournaments(target_tournaments)
+        with SC2Scraper(config) as scraper:
+            # Find subevents and scrape them
+            subevents = scraper.find_subevents(tournament_series)
+            target_tournaments = [f"{tournament_series}/{subevent}" for subevent in subevents]
+            
+            print(f"Found {len(target_tournaments)} tournaments to scrape")
+            
+            # Run the scraper
+            combined_data = scraper.scrape_multiple_tournaments(target_tournaments)
         
         if not combined_data:
             print("Failed to scrape tournament data")
@@ -53,13 +54,12 @@ def main():
         
         # Try to insert into database
         from database_inserter import insert_tournament_data
-        import json
+        from json_utils import write_json_file
         import os
         
-        # Save to temp file first
+        # Save to temp file first (only read back by the inserter, so skip indentation)
         temp_file = os.path.join(os.path.dirname(__file__), 'temp_data.json')
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(combined_data, f, indent=2, ensure_ascii=False, default=str)
+        write_json_file(Path(temp_file), combined_data)
         
         # Insert into database
         success = insert_tournament_data(temp_file, config)
@@ -4,12 +4,19 @@ Working scraper that extracts tournament data and outputs it in a format
 that can be used to populate the database via MCP tools.
 """
 
+import hashlib
 import logging
-import json
 import re
-from typing import List, Dict, Set
-from database_inserter import insert_tournament_data
-from scraper_config import load_scraper_config, ScraperConfig, config
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
+from database_inserter import TournamentDatabaseWriter
+from json_utils import dump_json_bytes, read_json_file, write_json_file
+from scraper_config import get_config, ScraperConfig
 from liquipedia_client import LiquipediaClient
 from data_parser import DataParser
 
@@ -24,17 +31,70 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsing or conversion output changes so stale cached parses are ignored
+PARSE_CACHE_VERSION = 1
+
+# Known non-tournament page patterns (case-insensitive)
+NON_TOURNAMENT_PATTERNS = (
+    'standings', 'statistics', 'results', 'participants', 'format',
+    'maps', 'schedule', 'broadcast', 'vods', 'replays', 'links',
+    'gallery', 'media', 'news', 'coverage'
+)
+
+# Tournament page indicators (case-insensitive)
+TOURNAMENT_INDICATORS = (
+    '{{Infobox',  # Tournament infobox
+    'bracket', 'match', 'result', 'score',  # Match-related content
+    'prize', 'pool', 'format',  # Tournament info
+    'participant', 'player', 'team',  # Competitors
+)
+
+# Each pattern list combined into one case-insensitive scan
+_NON_TOURNAMENT_RE = re.compile('|'.join(map(re.escape, NON_TOURNAMENT_PATTERNS)), re.IGNORECASE)
+_TOURNAMENT_INDICATOR_RE = re.compile('|'.join(map(re.escape, TOURNAMENT_INDICATORS)), re.IGNORECASE)
+
+# Indicators (infobox, prize pool, format, bracket) appear near the top of the page
+INDICATOR_SCAN_CHARS = 4096
+
+
+@lru_cache(maxsize=4096)
+def _normalize_team_name(team_name: str) -> str:
+    """
+    Normalize a team name to ensure consistent alphabetical ordering.
+    
+    Memoized because the same team names recur in every match of a bracket.
+    """
+    separator = team_name.find(' + ') if team_name else -1
+    if separator == -1:
+        return team_name
+    if team_name.find(' + ', separator + 3) != -1:
+        return team_name  # Not a 2-player team
+    player1 = team_name[:separator].strip()
+    player2 = team_name[separator + 3:].strip()
+    return f"{player1} + {player2}" if player1 <= player2 else f"{player2} + {player1}"
+
 
 class SC2Scraper:
     """Enhanced scraper for SC2 tournament data from Liquipedia with subevent detection."""
     
     def __init__(self, scraper_config: ScraperConfig = None):
         """Initialize the scraper with configuration."""
-        self.config = scraper_config or config
+        self.config = scraper_config or get_config()
         self.client = LiquipediaClient(self.config)
-        self.parser = DataParser()
+        # Pages confirmed by find_subevents are reused when scraping them
+        self._page_cache: Dict[str, str] = {}
         
         logger.debug("SC2 Scraper initialized")
+    
+    def close(self):
+        """Release the client's pooled HTTP connections."""
+        self.client.close()
+    
+    def __enter__(self) -> "SC2Scraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def find_subevents(self, tournament_series: str) -> List[str]:
         """
@@ -52,10 +112,18 @@ class SC2Scraper:
         api_subevents = self._find_subevents_via_api(tournament_series)
         
         # Filter out non-tournament pages
-        tournament_subevents = self._filter_tournament_pages(tournament_series, set(api_subevents))
+        tournament_pages = self._filter_tournament_pages(tournament_series, set(api_subevents))
+        
+        # Hand the confirmed pages to the scrape phase so they are not downloaded again
+        tournament_subevents = []
+        for subevent, content in tournament_pages:
+            self._page_cache[f"{tournament_series}/{subevent}"] = content
+            tournament_subevents.append(subevent)
         
-        logger.debug(f"Found {len(tournament_subevents)} tournament subevents: {sorted(tournament_subevents)}")
-        return sorted(tournament_subevents)
+        tournament_subevents.sort()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found %d tournament subevents: %s", len(tournament_subevents), tournament_subevents)
+        return tournament_subevents
     
     def _find_subevents_via_api(self, tournament_series: str) -> List[str]:
         """Find subevents using MediaWiki API to query all pages with the series prefix."""
@@ -68,22 +136,23 @@ class SC2Scraper:
                 'action': 'query',
                 'list': 'allpages',
                 'apprefix': f'{series_with_spaces}/',
-                'aplimit': 100,  # Increase limit to catch more subevents
+                'aplimit': 500,  # Maximum page size for non-bot accounts
                 'format': 'json'
             }
             
-            # Use the client's robust request method with retry logic
-            data = self.client._make_request(params)
-            pages = data.get('query', {}).get('allpages', [])
+            # Follow continuation so series with more pages than one batch are not truncated
+            pages = []
+            while True:
+                # Use the client's robust request method with retry logic
+                data = self.client._make_request(params)
+                pages.extend(data.get('query', {}).get('allpages', []))
+                if 'continue' not in data:
+                    break
+                params = {**params, **data['continue']}
             
-            # Extract subevent names (remove the series prefix)
-            subevents = []
-            for page in pages:
-                title = page.get('title', '')
-                # Use the space version for matching since that's what the API returns
-                if title.startswith(f'{series_with_spaces}/'):
-                    subevent = title.replace(f'{series_with_spaces}/', '', 1)
-                    subevents.append(subevent)
+            # Extract subevent names; apprefix guarantees every title starts with the series prefix
+            prefix_len = len(series_with_spaces) + 1
+            subevents = [page['title'][prefix_len:] for page in pages if 'title' in page]
             
             logger.debug(f"API found {len(subevents)} pages")
             return subevents
@@ -99,62 +168,40 @@ class SC2Scraper:
     
     def _is_likely_tournament_page(self, content: str) -> bool:
         """Quick check to determine if a page is likely a tournament page."""
-        # Check for tournament indicators
-        tournament_indicators = [
-            '{{Infobox',  # Tournament infobox
-            'bracket', 'match', 'result', 'score',  # Match-related content
-            'prize', 'pool', 'format',  # Tournament info
-            'participant', 'player', 'team',  # Competitors
-        ]
-        
-        content_lower = content.lower()
-        indicator_count = sum(1 for indicator in tournament_indicators if indicator in content_lower)
-        
-        # If we find multiple indicators, it's likely a tournament page
-        return indicator_count >= 2
+        # If we find multiple distinct indicators, it's likely a tournament page
+        found_indicators = set()
+        for indicator in _TOURNAMENT_INDICATOR_RE.finditer(content, 0, INDICATOR_SCAN_CHARS):
+            found_indicators.add(indicator.group(0).lower())
+            if len(found_indicators) >= 2:
+                return True
+        return False
     
-    def _filter_tournament_pages(self, tournament_series: str, subevents: Set[str]) -> List[str]:
-        """Filter out non-tournament pages from the subevent list."""
-        # Known non-tournament page patterns (case-insensitive)
-        non_tournament_patterns = [
-            'standings', 'statistics', 'results', 'participants', 'format',
-            'maps', 'schedule', 'broadcast', 'vods', 'replays', 'links',
-            'gallery', 'media', 'news', 'coverage'
-        ]
-        
-        tournament_subevents = []
+    def _filter_tournament_pages(self, tournament_series: str, subevents: Set[str]) -> List[Tuple[str, str]]:
+        """Filter out non-tournament pages, returning (subevent, page content) pairs for the rest."""
+        tournament_pages = []
         
         logger.debug(f"Filtering {len(subevents)} potential subevents...")
         
-        for subevent in subevents:
+        candidates = []
+        # Sorted so batch requests, and their cache keys, are stable between runs
+        for subevent in sorted(subevents):
             # Skip if it matches non-tournament patterns
-            subevent_lower = subevent.lower()
-            if any(pattern in subevent_lower for pattern in non_tournament_patterns):
-                logger.debug(f"Skipping info page: {subevent}")
+            if _NON_TOURNAMENT_RE.search(subevent):
+                logger.debug("Skipping info page: %s", subevent)
                 continue
-            
-            # Quick content check to verify it's a tournament
-            try:
-                url = f"{tournament_series}/{subevent}"
-                content = self.client.get_page_content(url)
-                
-                if content and len(content) > 1000 and self._is_likely_tournament_page(content):
-                    tournament_subevents.append(subevent)
-                    logger.debug(f"Confirmed tournament: {subevent}")
-            except Exception as e:
-                logger.warning(f"Error checking {subevent}: {e}")
+            candidates.append(subevent)
         
-        return tournament_subevents
-    
-    def _normalize_team_name(self, team_name: str) -> str:
-        """Normalize a team name to ensure consistent alphabetical ordering."""
-        if not team_name or ' + ' not in team_name:
-            return team_name
-        players = [name.strip() for name in team_name.split(' + ')]
-        if len(players) == 2:
-            normalized_players = sorted(players)
-            return f"{normalized_players[0]} + {normalized_players[1]}"
-        return team_name
+        # Quick content check to verify each candidate is a tournament, fetching pages in batches
+        candidate_titles = {f"{tournament_series}/{subevent}": subevent for subevent in candidates}
+        page_contents = self.client.get_pages_content(list(candidate_titles))
+        
+        for title, subevent in candidate_titles.items():
+            content = page_contents.get(title)
+            if content and len(content) > 1000 and self._is_likely_tournament_page(content):
+                tournament_pages.append((subevent, content))
+                logger.debug("Confirmed tournament: %s", subevent)
+        
+        return tournament_pages
     
     def _merge_teams(self, teams_data: list, all_teams: dict) -> None:
         """Merge teams data avoiding duplicates by normalized player combination."""
@@ -162,20 +209,28 @@ class SC2Scraper:
             player1 = team['player1_name']
             player2 = team['player2_name']
             
-            # Create normalized team key and data
-            normalized_players = sorted([player1, player2])
-            team_key = f"{normalized_players[0]}+{normalized_players[1]}"
+            # Normalized (alphabetical) player pair doubles as the team key
+            team_key = (player1, player2) if player1 <= player2 else (player2, player1)
             
+            # Only build the entry (and its name string) for teams not seen yet
             if team_key not in all_teams:
                 all_teams[team_key] = {
-                    'name': f"{normalized_players[0]} + {normalized_players[1]}",
-                    'player1_name': normalized_players[0],
-                    'player2_name': normalized_players[1]
+                    'name': f"{team_key[0]} + {team_key[1]}",
+                    'player1_name': team_key[0],
+                    'player2_name': team_key[1]
                 }
     
-    def _merge_matches(self, matches_data: list, tournament_slug: str, all_matches: list) -> None:
+    def _merge_matches(self, matches_data: list, tournament_slug: str, all_matches: list,
+                       teams_data: list = ()) -> None:
         """Merge matches data with tournament reference and normalized team names."""
-        tournament_prefix = tournament_slug.split('/')[-1]  # Get last part (e.g., "Main_Event" or "1")
+        tournament_prefix = sys.intern(tournament_slug.rsplit('/', 1)[-1])  # Get last part (e.g., "Main_Event" or "1")
+        tournament_slug = sys.intern(tournament_slug)
+        
+        # Normalize each of the tournament's teams once; matches reuse the interned names
+        normalized_names = {team['name']: sys.intern(_normalize_team_name(team['name'])) for team in teams_data}
+        
+        def normalize(team_name: str) -> str:
+            return normalized_names.get(team_name) or _normalize_team_name(team_name)
         
         for match in matches_data:
             match["tournament_slug"] = tournament_slug
@@ -185,77 +240,182 @@ class SC2Scraper:
             match["match_id"] = f"{tournament_prefix}_{original_match_id}"
             
             # Normalize team names to match the normalized teams list
-            match["team1_name"] = self._normalize_team_name(match.get("team1_name", ""))
-            match["team2_name"] = self._normalize_team_name(match.get("team2_name", ""))
+            match["team1_name"] = normalize(match.get("team1_name", ""))
+            match["team2_name"] = normalize(match.get("team2_name", ""))
             if "winner_name" in match:
-                match["winner_name"] = self._normalize_team_name(match["winner_name"])
+                match["winner_name"] = normalize(match["winner_name"])
             
             all_matches.append(match)
     
-    def scrape_tournament(self, tournament_slug: str) -> Dict:
+    def scrape_tournament(self, tournament_slug: str, page_content: Optional[str] = None) -> Dict:
         """
         Scrape a single tournament and return structured data.
         
         Args:
             tournament_slug: Full tournament slug (e.g., "UThermal_2v2_Circuit/1")
+            page_content: Already fetched page wikitext; fetched if not given
             
         Returns:
             Dictionary with tournament data ready for database insertion
         """
-        logger.debug(f"Scraping tournament: {tournament_slug}")
+        logger.debug("Scraping tournament: %s", tournament_slug)
         
         # Get tournament page content
-        page_content = self.client.get_page_content(tournament_slug)
+        if page_content is None:
+            page_content = self._fetch(tournament_slug)
+        return self._parse_tournament_page(tournament_slug, page_content)
+    
+    def _fetch(self, page_title: str) -> Optional[str]:
+        """
+        Get page content, reusing a page confirmed by find_subevents if there is one.
+        
+        Reused pages are removed from the cache, so each page's wikitext is only kept
+        in memory until it has been parsed.
+        """
+        page_content = self._page_cache.pop(page_title, None)
+        if page_content is None:
+            page_content = self.client.get_page_content(page_title)
+        return page_content
+    
+    def _fetch_tournament_pages(self, tournament_slugs: List[str]) -> Iterator[Tuple[int, str, Optional[str]]]:
+        """Fetch tournament pages concurrently, yielding (index, slug, content) as each fetch completes."""
+        max_workers = max(1, min(self.config.max_workers, len(tournament_slugs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._fetch, slug): (index, slug)
+                       for index, slug in enumerate(tournament_slugs)}
+            for future in as_completed(futures):
+                index, slug = futures[future]
+                yield index, slug, future.result()
+    
+    def _parse_tournament_page(self, tournament_slug: str, page_content: Optional[str]) -> Optional[Dict]:
+        """Parse fetched tournament page content into database format."""
         if not page_content:
             logger.error(f"Failed to fetch page content for {tournament_slug}")
             return None
         
-        logger.debug(f"Successfully fetched page content: {len(page_content)} characters")
+        logger.debug("Successfully fetched page content: %d characters", len(page_content))
+        
+        # Unchanged page content parses to the same result, so skip parsing entirely
+        cache_key = self._get_parse_cache_key(tournament_slug, page_content)
+        cached_data = self._get_cached_parse(tournament_slug, cache_key)
+        if cached_data:
+            logger.debug("Parse cache hit: %s", tournament_slug)
+            return cached_data
+        
+        # A fresh parser per page keeps player/team caches from leaking between tournaments
+        parser = DataParser()
         
         # Parse tournament metadata
-        tournament = self.parser.parse_tournament_from_wikitext(tournament_slug, page_content)
+        parse_start = time.perf_counter()
+        tournament = parser.parse_tournament_from_wikitext(tournament_slug, page_content)
         
-        logger.debug(f"Parsed tournament: {tournament.name}")
+        logger.debug("Parsed tournament: %s", tournament.name)
         
         # Parse matches from wikitext
-        self.parser.parse_matches_from_wikitext(tournament, page_content)
+        parser.parse_matches_from_wikitext(tournament, page_content)
         
         # Convert to database format
-        return self._convert_tournament_to_db_format(tournament)
+        tournament_data = self._convert_tournament_to_db_format(tournament)
+        logger.debug("Parsed %s in %.3fs", tournament_slug, time.perf_counter() - parse_start)
+        self._cache_parse(tournament_slug, cache_key, tournament_data)
+        return tournament_data
+    
+    def _get_parse_cache_key(self, tournament_slug: str, page_content: str) -> str:
+        """Hash the slug and page content into a parse cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{PARSE_CACHE_VERSION}:{tournament_slug}\0".encode('utf-8'))
+        digest.update(page_content.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _get_parse_cache_path(self, tournament_slug: str) -> Optional[Path]:
+        """Get the on-disk location of a tournament's cached parse, or None when caching is disabled."""
+        if not self.config.enable_cache:
+            return None
+        # One file per tournament, so a re-parse after a page edit replaces the old entry
+        slug_hash = hashlib.blake2b(tournament_slug.encode('utf-8'), digest_size=16).hexdigest()
+        return self.config.cache_dir / f"parsed_{slug_hash}.json"
     
-    def scrape_multiple_tournaments(self, tournament_slugs: List[str]) -> Dict:
+    def _get_cached_parse(self, tournament_slug: str, cache_key: str) -> Optional[Dict]:
+        """Return the cached parse of a tournament if it was made from the same page content."""
+        cache_file = self._get_parse_cache_path(tournament_slug)
+        if not cache_file or not cache_file.exists():
+            return None
+        
+        try:
+            cached = read_json_file(cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to read parse cache {cache_file}: {e}")
+            return None
+        
+        if cached.get('key') != cache_key:
+            return None
+        return cached.get('data')
+    
+    def _cache_parse(self, tournament_slug: str, cache_key: str, tournament_data: Dict) -> None:
+        """Write a tournament's parse result to disk, keyed by its page content hash."""
+        cache_file = self._get_parse_cache_path(tournament_slug)
+        if cache_file:
+            cached = {'key': cache_key, 'data': tournament_data}
+            try:
+                write_json_file(cache_file, cached)
+            except Exception as e:
+                logger.warning(f"Failed to write parse cache {cache_file}: {e}")
+    
+    def scrape_multiple_tournaments(self, tournament_slugs: List[str],
+                                    on_tournament: Optional[Callable[[Dict], None]] = None) -> Dict:
         """
         Scrape multiple tournaments and merge their data.
         
+        Page fetches are network-bound, so they run concurrently (bounded by
+        ``config.max_workers``). Each tournament is parsed and handed to
+        ``on_tournament`` as soon as its page arrives; the combined result is
+        merged in slug order so the output does not depend on fetch timing.
+        
         Args:
             tournament_slugs: List of tournament slugs to scrape
+            on_tournament: Optional callback receiving each tournament's data
+                as soon as it is parsed (e.g. to write it to the database)
             
         Returns:
             Combined tournament data ready for database insertion
         """
         logger.debug(f"Scraping {len(tournament_slugs)} tournaments")
+        start = time.perf_counter()
+        
+        scraped = {}  # slug index -> (tournament data, merged matches)
+        
+        for index, slug, page_content in self._fetch_tournament_pages(tournament_slugs):
+            tournament_data = self._parse_tournament_page(slug, page_content)
+            if tournament_data:
+                # Tag matches with their tournament before handing the data on
+                tournament_matches = []
+                self._merge_matches(tournament_data["matches"], slug, tournament_matches,
+                                    tournament_data["teams"])
+                scraped[index] = (tournament_data, tournament_matches)
+                logger.info("Scraped %s (%d/%d)", slug, len(scraped), len(tournament_slugs))
+                
+                if on_tournament:
+                    on_tournament(tournament_data)
         
         all_tournaments = []
         all_players = {}
         all_teams = {}
         all_matches = []
         
-        for slug in tournament_slugs:
-            # Clear parser caches to avoid conflicts between tournaments
-            self.parser.players_cache.clear()
-            self.parser.teams_cache.clear()
+        for index in sorted(scraped):
+            tournament_data, tournament_matches = scraped[index]
+            all_tournaments.append(tournament_data["tournament"])
             
-            tournament_data = self.scrape_tournament(slug)
-            if tournament_data:
-                all_tournaments.append(tournament_data["tournament"])
-                
-                # Merge players (avoid duplicates by name)
-                for player in tournament_data["players"]:
-                    all_players[player["name"]] = player
-                
-                # Merge teams and matches
-                self._merge_teams(tournament_data["teams"], all_teams)
-                self._merge_matches(tournament_data["matches"], slug, all_matches)
+            # Merge players (avoid duplicates by name)
+            for player in tournament_data["players"]:
+                all_players[player["name"]] = player
+            
+            # Merge teams and matches
+            self._merge_teams(tournament_data["teams"], all_teams)
+            all_matches.extend(tournament_matches)
+        
+        logger.info(f"Scraped {len(all_tournaments)}/{len(tournament_slugs)} tournaments "
+                    f"in {time.perf_counter() - start:.1f}s")
         
         return {
             "tournaments": all_tournaments,
@@ -266,69 +426,27 @@ class SC2Scraper:
     
     def _convert_tournament_to_db_format(self, tournament) -> Dict:
         """Convert a Tournament object to database format."""
-        # Convert tournament to database format
-        tournament_data = {
-            "name": tournament.name,
-            "liquipedia_slug": tournament.liquipedia_slug,
-            "start_date": str(tournament.start_date) if tournament.start_date else None,
-            "end_date": str(tournament.end_date) if tournament.end_date else None,
-            "prize_pool": tournament.prize_pool,
-            "location": tournament.location,
-            "status": tournament.status.value
-        }
+        # Convert tournament to database format, storing dates as strings and empty dates as None
+        tournament_data = tournament.to_db_dict()
+        for date_field in ("start_date", "end_date"):
+            date_value = tournament_data[date_field]
+            tournament_data[date_field] = str(date_value) if date_value else None
         
         # Convert players to database format
-        players_data = []
-        for player in tournament.players:
-            players_data.append({
-                "liquipedia_slug": player.liquipedia_slug,
-                "name": player.name,
-                "nationality": player.nationality,
-                "preferred_race": player.race
-            })
+        players_data = [player.to_db_dict() for player in tournament.players]
         
         # Convert teams to database format
-        teams_data = []
-        for team in tournament.teams:
-            teams_data.append({
+        teams_data = [
+            {
                 "name": team.name,
                 "player1_name": team.player1.name,
                 "player2_name": team.player2.name
-            })
+            }
+            for team in tournament.teams
+        ]
         
         # Convert matches to database format
-        matches_data = []
-        for match in tournament.matches:
-            match_data = {
-                "match_id": match.match_id,
-                "team1_name": match.team1.name,
-                "team2_name": match.team2.name,
-                "best_of": match.best_of,
-                "status": match.status.value,
-                "stage": match.stage,
-                "team1_score": match.team1_score,
-                "team2_score": match.team2_score
-            }
-            
-            # Add winner info if available
-            if match.winner:
-                match_data["winner_name"] = match.winner.name
-            
-            # Add games
-            games_data = []
-            for game in match.games:
-                game_data = {
-                    "game_number": game.game_number,
-                    "map_name": game.map_name
-                }
-                if game.winner:
-                    game_data["winner_name"] = game.winner.name
-                if game.duration_seconds:
-                    game_data["duration_seconds"] = game.duration_seconds
-                games_data.append(game_data)
-            
-            match_data["games"] = games_data
-            matches_data.append(match_data)
+        matches_data = [self._convert_match_to_db_format(match) for match in tournament.matches]
         
         return {
             "tournament": tournament_data,
@@ -336,18 +454,52 @@ class SC2Scraper:
             "teams": teams_data,
             "matches": matches_data
         }
+    
+    def _convert_match_to_db_format(self, match) -> Dict:
+        """Convert a Match object, including its games, to database format."""
+        match_data = {
+            "match_id": match.match_id,
+            "team1_name": match.team1.name,
+            "team2_name": match.team2.name,
+            "best_of": match.best_of,
+            "status": match.status.value,
+            "stage": match.stage,
+            "team1_score": match.team1_score,
+            "team2_score": match.team2_score
+        }
+        
+        # Add winner info if available
+        if match.winner:
+            match_data["winner_name"] = match.winner.name
+        
+        match_data["games"] = [self._convert_game_to_db_format(game) for game in match.games]
+        return match_data
+    
+    def _convert_game_to_db_format(self, game) -> Dict:
+        """Convert a Game object to database format."""
+        game_data = {
+            "game_number": game.game_number,
+            "map_name": game.map_name
+        }
+        if game.winner:
+            game_data["winner_name"] = game.winner.name
+        if game.duration_seconds:
+            game_data["duration_seconds"] = game.duration_seconds
+        return game_data
         
 
 def main():
     """Scrape UThermal tournament with automatic subevent detection - ALL subevents."""
     logger.info("Enhanced SC2 Tournament Scraper with Subevent Detection")
     
-    scraper = SC2Scraper()
     tournament_series = "UThermal_2v2_Circuit"
+    database_writer = _start_database_writer()
     
     try:
-        # Scrape all tournaments
-        combined_data = _scrape_all_tournaments(scraper, tournament_series)
+        # Scrape all tournaments, writing each to the database as soon as it is parsed
+        on_tournament = database_writer.submit if database_writer else None
+        with SC2Scraper() as scraper:
+            combined_data = _scrape_all_tournaments(scraper, tournament_series, on_tournament)
         if not combined_data:
             logger.error("Failed to scrape tournament data")
             return
@@ -356,21 +508,25 @@ def main():
         _show_scraping_summary(combined_data)
         json_file_path = _save_tournament_data(combined_data)
         
-        # Attempt database insertion
-        _attempt_database_insertion(json_file_path)
+        # Wait for pending database writes
+        _finish_database_insertion(database_writer, json_file_path)
         
     except Exception as e:
         logger.error(f"Scraping failed: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if database_writer:
+            database_writer.close()
 
 
-def _scrape_all_tournaments(scraper: SC2Scraper, tournament_series: str) -> dict:
+def _scrape_all_tournaments(scraper: SC2Scraper, tournament_series: str,
+                            on_tournament: Optional[Callable[[Dict], None]] = None) -> dict:
     """Find and scrape all tournaments in the series."""
     subevents = scraper.find_subevents(tournament_series)
     target_tournaments = [f"{tournament_series}/{subevent}" for subevent in subevents]
     logger.info(f"Scraping {len(target_tournaments)} tournaments...")
-    return scraper.scrape_multiple_tournaments(target_tournaments)
+    return scraper.scrape_multiple_tournaments(target_tournaments, on_tournament)
 
 
 def _show_scraping_summary(combined_data: dict) -> None:
@@ -382,16 +538,36 @@ def _show_scraping_summary(combined_data: dict) -> None:
     logger.info(f"   Matches: {len(combined_data['matches'])}")
     
     # Show match distribution
-    match_by_tournament = {}
-    for match in combined_data['matches']:
-        slug = match.get('tournament_slug', 'unknown')
-        match_by_tournament[slug] = match_by_tournament.get(slug, 0) + 1
+    match_by_tournament = Counter(match.get('tournament_slug', 'unknown') for match in combined_data['matches'])
     
     logger.info(f"Match Distribution:")
     for slug, count in match_by_tournament.items():
         logger.info(f"     {slug}: {count} matches")
 
 
+def _write_json_streaming(f, data: dict) -> None:
+    """
+    Write a dict of lists as indented JSON, serializing one list item at a time.
+    
+    The layout is identical to dumping the whole dict with indent=2, but the
+    serialized output is never held in memory all at once.
+    """
+    f.write(b"{")
+    for key_index, (key, value) in enumerate(data.items()):
+        f.write(b",\n  " if key_index else b"\n  ")
+        f.write(dump_json_bytes(key) + b": ")
+        if isinstance(value, list) and value:
+            f.write(b"[")
+            for item_index, item in enumerate(value):
+                f.write(b",\n    " if item_index else b"\n    ")
+                # JSON strings never contain raw newlines, so this only re-indents the layout
+                f.write(dump_json_bytes(item).replace(b"\n", b"\n    "))
+            f.write(b"\n  ]")
+        else:
+            f.write(dump_json_bytes(value).replace(b"\n", b"\n  "))
+    f.write(b"\n}" if data else b"}")
+
+
 def _save_tournament_data(combined_data: dict) -> str:
     """Save tournament data to JSON file."""
     import os
@@ -400,30 +576,33 @@ def _save_tournament_data(combined_data: dict) -> str:
     project_root = os.path.dirname(os.path.dirname(current_dir))
     json_file_path = os.path.join(project_root, "output", "tournament_data.json")
     
-    with open(json_file_path, "w", encoding="utf-8") as f:
-        json.dump(combined_data, f, indent=2, ensure_ascii=False, default=str)
+    with open(json_file_path, "wb") as f:
+        _write_json_streaming(f, combined_data)
     
     logger.info(f"Data saved to {json_file_path}")
     return json_file_path
 
 
-def _attempt_database_insertion(json_file_path: str) -> None:
-    """Attempt to insert data into database."""
-    logger.info("Attempting database insertion...")
+def _start_database_writer() -> Optional[TournamentDatabaseWriter]:
+    """Start the background database writer, or return None if the database is unavailable."""
+    logger.info("Connecting to database for insertion...")
     try:
-        config = load_scraper_config()
-        success = insert_tournament_data(json_file_path, config)
-        
-        if success:
-            logger.info("Database insertion completed successfully!")
-        else:
-            logger.warning("Database insertion skipped or failed.")
-            logger.info(f"Data is ready in {json_file_path} for MCP-based insertion")
-            
+        database_writer = TournamentDatabaseWriter(get_config())
+        if database_writer.start():
+            return database_writer
     except Exception as e:
         logger.warning(f"Direct database connection failed: {str(e)[:100]}...")
+        logger.debug(f"Database connection failed: {e}", exc_info=True)
+    return None
+
+
+def _finish_database_insertion(database_writer: Optional[TournamentDatabaseWriter], json_file_path: str) -> None:
+    """Wait for queued database writes and report the outcome."""
+    if database_writer and database_writer.close():
+        logger.info("Database insertion completed successfully!")
+    else:
+        logger.warning("Database insertion skipped or failed.")
         logger.info(f"Data is ready in {json_file_path} for MCP-based insertion")
-        logger.debug(f"Database insertion failed: {e}", exc_info=True)
 
 if __name__ == "__main__":
     main()
@@ -6,18 +6,16 @@ from __future__ import annotations
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 try:
     from dotenv import load_dotenv  # type: ignore
-    # Load environment variables from project root
-    project_root = Path(__file__).parent.parent.parent
-    env_path = project_root / '.env'
-    load_dotenv(env_path)
+    DOTENV_AVAILABLE = True
 except ImportError:
     # python-dotenv not installed, continue without it
-    pass
+    DOTENV_AVAILABLE = False
 
 
 @dataclass
@@ -48,21 +46,33 @@ class ScraperConfig:
     supabase_service_key: Optional[str] = None
     database_url: Optional[str] = None
     enable_database: bool = True
+    db_max_workers: int = 8  # Concurrent in-flight database requests
+    
+    # Concurrency settings
+    max_workers: int = 4  # Concurrent in-flight Liquipedia page fetches
     
     def __post_init__(self):
         """Post-initialization validation and setup."""
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Set up logging
+        # Set up logging; the root level is applied explicitly because an importer
+        # may already have called basicConfig, which makes a second call a no-op
+        level = getattr(logging, self.log_level.upper())
         logging.basicConfig(
-            level=getattr(logging, self.log_level.upper()),
+            level=level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
+        logging.getLogger().setLevel(level)
 
 
 def load_scraper_config() -> ScraperConfig:
     """Load scraper configuration from environment variables."""
+    if DOTENV_AVAILABLE:
+        # Load environment variables from project root
+        project_root = Path(__file__).parent.parent.parent
+        load_dotenv(project_root / '.env')
+    
     return ScraperConfig(
         # Liquipedia API settings
         user_agent=os.getenv(
@@ -94,8 +104,14 @@ def load_scraper_config() -> ScraperConfig:
         supabase_service_key=os.getenv("SUPABASE_SERVICE_KEY"),
         database_url=os.getenv("DATABASE_URL"),
         enable_database=os.getenv("ENABLE_DATABASE", "true").lower() == "true",
+        db_max_workers=int(os.getenv("DB_MAX_WORKERS", "8")),
+        
+        # Concurrency
+        max_workers=int(os.getenv("MAX_WORKERS", "4")),
     )
 
 
-# Global config instance
-config = load_scraper_config()
+@lru_cache(maxsize=None)
+def get_config() -> ScraperConfig:
+    """Get the shared configuration, loading it from the environment on first use."""
+    return load_scraper_config()